@@ -38,6 +38,7 @@ class MST_Result:
         self.edges: List[Edge] = []
         self.total_cost: float = 0
         self.steps: List[MST_Step] = []
+        self.edges_examined: int = 0
     
     def add_edge(self, edge: Edge):
         self.edges.append(edge)
@@ -47,7 +48,8 @@ class MST_Result:
         return {
             'edges': [edge.to_dict() for edge in self.edges],
             'total_cost': self.total_cost,
-            'steps': [step.to_dict() for step in self.steps]
+            'steps': [step.to_dict() for step in self.steps],
+            'edges_examined': self.edges_examined
         }
 
 class Graph:
@@ -98,6 +100,7 @@ class MST_Solver:
         self.current_steps.append(step)
         
         for edge in sorted_edges:
+            result.edges_examined += 1
             u_idx = vertex_to_index[edge.u]
             v_idx = vertex_to_index[edge.v]
             
@@ -143,6 +146,7 @@ class MST_Solver:
         
         while edges_pq and len(visited) < len(vertices):
             weight, u, v = heapq.heappop(edges_pq)
+            result.edges_examined += 1
             
             if v in visited:
                 step = MST_Step("reject", Edge(u, v, weight), False,
@@ -169,5 +173,226 @@ class MST_Solver:
         result.steps = self.current_steps
         return result
     
+    def prim_multi_source(self, graph: Graph, sources: List[str]) -> MST_Result:
+        """
+        Grow one Prim tree from each source at the same time. All frontiers
+        share a single heap, so the popped edge is always the lightest edge
+        leaving some tree; trees merge when that edge reaches another tree.
+        """
+        sources = [s for s in dict.fromkeys(sources) if s in graph.vertices]
+        if len(sources) <= 1:
+            return self.prim(graph, sources[0] if sources else None)
+        
+        result = MST_Result()
+        self.current_steps = []
+        
+        vertices = sorted(list(graph.vertices))
+        vertex_to_index = {v: i for i, v in enumerate(vertices)}
+        uf = UnionFind(len(vertices))
+        visited = set(sources)
+        edges_pq = []
+        
+        def components():
+            return [[vertices[i] for i in comp] for comp in uf.get_components()]
+        
+        def push_frontier(vertex):
+            root = uf.find(vertex_to_index[vertex])
+            for neighbor, weight in graph.get_neighbors(vertex):
+                if uf.find(vertex_to_index[neighbor]) != root:
+                    heapq.heappush(edges_pq, (weight, vertex, neighbor))
+        
+        for source in sources:
+            push_frontier(source)
+        
+        step = MST_Step("init", None, False, components(),
+                       f"Bắt đầu đồng thời từ {len(sources)} đỉnh: {', '.join(sources)}")
+        self.current_steps.append(step)
+        
+        while edges_pq and len(result.edges) < len(vertices) - 1:
+            weight, u, v = heapq.heappop(edges_pq)
+            result.edges_examined += 1
+            
+            if not uf.union(vertex_to_index[u], vertex_to_index[v]):
+                step = MST_Step("reject", Edge(u, v, weight), False, components(),
+                               f"Từ chối cạnh {u}-{v} (tạo chu trình)")
+                step.total_cost = result.total_cost
+                self.current_steps.append(step)
+                continue
+            
+            edge = Edge(u, v, weight)
+            result.add_edge(edge)
+            
+            if v in visited:
+                explanation = f"Nối hai cây qua cạnh {u}-{v} (trọng số {weight})"
+            else:
+                explanation = f"Chấp nhận cạnh {u}-{v} (trọng số {weight})"
+            step = MST_Step("accept", edge, True, components(), explanation)
+            step.total_cost = result.total_cost
+            self.current_steps.append(step)
+            
+            if v not in visited:
+                visited.add(v)
+                push_frontier(v)
+        
+        result.steps = self.current_steps
+        return result
+    
+    def warm_start(self, graph: Graph, previous: MST_Result, added_vertices=(),
+                   removed_vertices=(), changed_edges=()) -> MST_Result:
+        """
+        Recompute the MST of ``graph`` from the tree of a previous solve.
+
+        ``changed_edges`` lists ``(u, v)`` pairs whose weight changed; a moved
+        vertex is passed as both removed and added. The solve has two phases:
+
+        1. Repair: previous tree edges that were removed or got heavier are
+           dropped. The surviving edges stay in the tree, and only the graph
+           edges crossing the resulting pieces are sorted to rejoin them.
+           Added vertices and entering edges are left out of this phase.
+        2. Insert: by the cycle property an edge outside the repaired tree
+           stays outside unless it touches an added vertex or is a
+           re-weighted edge whose new weight is below the heaviest edge on
+           its path in the previous tree. Kruskal runs over just those
+           candidates and the repaired tree.
+        """
+        result = MST_Result()
+        self.current_steps = []
+        
+        vertices = sorted(list(graph.vertices))
+        vertex_to_index = {v: i for i, v in enumerate(vertices)}
+        uf = UnionFind(len(vertices))
+        
+        added = set(added_vertices) & graph.vertices
+        removed = set(removed_vertices)
+        changed = {frozenset(pair) for pair in changed_edges}
+        
+        neighbor_weights: Dict[str, Dict[str, float]] = {}
+        
+        def current_weight(u, v):
+            if v in neighbor_weights:
+                u, v = v, u
+            if u not in neighbor_weights:
+                neighbor_weights[u] = dict(graph.get_neighbors(u))
+            return neighbor_weights[u].get(v)
+        
+        def components():
+            return [[vertices[i] for i in comp] for comp in uf.get_components()]
+        
+        previous_tree: Dict[str, List[Tuple[str, float]]] = {}
+        for edge in previous.edges:
+            previous_tree.setdefault(edge.u, []).append((edge.v, edge.weight))
+            previous_tree.setdefault(edge.v, []).append((edge.u, edge.weight))
+        
+        def previous_path_max(u, v):
+            # Heaviest edge on the u-v path of the previous tree, None if unconnected
+            stack = [(u, None, float('-inf'))]
+            while stack:
+                vertex, parent, heaviest = stack.pop()
+                if vertex == v:
+                    return heaviest
+                for neighbor, weight in previous_tree.get(vertex, []):
+                    if neighbor != parent:
+                        stack.append((neighbor, vertex, max(heaviest, weight)))
+            return None
+        
+        def kruskal_pass(candidates, target_edges, tree, record):
+            for edge in sorted(candidates):
+                if len(tree) == target_edges:
+                    break
+                result.edges_examined += 1
+                accepted = uf.union(vertex_to_index[edge.u], vertex_to_index[edge.v])
+                if accepted:
+                    tree.append(edge)
+                if not record:
+                    continue
+                if accepted:
+                    result.add_edge(edge)
+                    step = MST_Step("accept", edge, True, components(),
+                                   f"Chấp nhận cạnh {edge.u}-{edge.v} (trọng số {edge.weight})")
+                else:
+                    step = MST_Step("reject", edge, False, components(),
+                                   f"Từ chối cạnh {edge.u}-{edge.v} (tạo chu trình)")
+                step.total_cost = result.total_cost
+                self.current_steps.append(step)
+        
+        seeds = []
+        invalidated = False
+        for edge in previous.edges:
+            if edge.u not in vertex_to_index or edge.v not in vertex_to_index or {edge.u, edge.v} & removed:
+                invalidated = True
+                continue
+            weight = edge.weight
+            if frozenset((edge.u, edge.v)) in changed:
+                weight = current_weight(edge.u, edge.v)
+                if weight is None or weight > edge.weight:
+                    invalidated = True
+                    continue
+            seeds.append(Edge(edge.u, edge.v, weight))
+        
+        tree_pairs = {frozenset((edge.u, edge.v)) for edge in previous.edges}
+        
+        # Re-weighted non-tree edges that now beat the old tree on their cycle
+        entering_edges = []
+        for pair in changed - tree_pairs:
+            if pair & added or not all(v in vertex_to_index for v in pair):
+                continue
+            u, v = sorted(pair)
+            weight = current_weight(u, v)
+            if weight is None:
+                continue
+            path_max = previous_path_max(u, v)
+            if path_max is None or weight < path_max:
+                entering_edges.append(Edge(u, v, weight))
+        
+        inserting = bool(added or entering_edges)
+        
+        # Phase 1: keep the surviving edges and rejoin the pieces they form
+        repaired = list(seeds)
+        for edge in seeds:
+            uf.union(vertex_to_index[edge.u], vertex_to_index[edge.v])
+        cut_edges = []
+        if invalidated:
+            entering_pairs = {frozenset((edge.u, edge.v)) for edge in entering_edges}
+            cut_edges = [edge for edge in graph.get_all_edges()
+                         if edge.u not in added and edge.v not in added
+                         and uf.find(vertex_to_index[edge.u]) != uf.find(vertex_to_index[edge.v])
+                         and frozenset((edge.u, edge.v)) not in entering_pairs]
+        
+        if not inserting:
+            for edge in seeds:
+                result.add_edge(edge)
+            step = MST_Step("init", None, False, components(),
+                           f"Khởi tạo lại từ cây trước: giữ {len(seeds)} cạnh, "
+                           f"xét {len(cut_edges)} cạnh nối các mảnh")
+            self.current_steps.append(step)
+            for edge in seeds:
+                step = MST_Step("accept", edge, True, components(),
+                               f"Giữ lại cạnh {edge.u}-{edge.v} từ cây trước (trọng số {edge.weight})")
+                step.total_cost = result.total_cost
+                self.current_steps.append(step)
+            kruskal_pass(cut_edges, len(vertices) - 1, repaired, True)
+            result.steps = self.current_steps
+            return result
+        
+        kruskal_pass(cut_edges, len(vertices) - len(added) - 1, repaired, False)
+        
+        # Phase 2: only the repaired tree, edges of new vertices and entering
+        # edges can belong to the new tree
+        candidates = repaired
+        for vertex in sorted(added):
+            for neighbor, weight in graph.get_neighbors(vertex):
+                if neighbor not in added or vertex < neighbor:
+                    candidates.append(Edge(vertex, neighbor, weight))
+        candidates.extend(entering_edges)
+        
+        uf = UnionFind(len(vertices))
+        step = MST_Step("init", None, False, components(),
+                       f"Khởi tạo lại từ cây trước: giữ {len(seeds)} cạnh, xét {len(candidates)} cạnh ứng viên")
+        self.current_steps.append(step)
+        kruskal_pass(candidates, len(vertices) - 1, [], True)
+        
+        result.steps = self.current_steps
+        return result
+    
     def get_step_by_step(self) -> List[Dict[str, Any]]:
         return [step.to_dict() for step in self.current_steps]
\ No newline at end of file
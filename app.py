@@ -1,19 +1,28 @@
 from flask import Flask, render_template, jsonify, request
 import os
 from algorithms.mst import MST_Solver, Graph
-from data.restaurants import RESTAURANTS, get_default_costs, get_cost_matrix, create_graph_from_costs, create_graph_from_selected_locations
+from data.cost_matrix import CostMatrix
+from data.restaurants import RESTAURANTS, get_default_costs, reset_default_costs, create_graph_from_costs, create_graph_from_selected_locations
 
 app = Flask(__name__)
 app.secret_key = 'mst_demo_secret_key'
 
-current_costs = get_default_costs().copy()
+current_costs = get_default_costs()
 selected_locations = []
 mst_solver = MST_Solver()
 current_result = None
+# Last tree solved for selected_locations, reused by warm-start solves
+last_selected_result = None
+last_solved_locations = []
+# Solved points moved since then, re-solved as removed and re-added
+moved_locations = set()
+
+def get_main_hubs(locations):
+    return [v for v in locations if v in RESTAURANTS and RESTAURANTS[v]['type'] == 'main']
 
 @app.route('/')
 def index():
-    return render_template('index.html', restaurants=RESTAURANTS, costs=get_cost_matrix())
+    return render_template('index.html', restaurants=RESTAURANTS, costs=current_costs.condensed())
 
 @app.route('/api/solve', methods=['POST'])
 def solve_mst():
@@ -30,6 +39,8 @@ def solve_mst():
             current_result = mst_solver.kruskal(graph)
         elif algorithm == 'prim':
             current_result = mst_solver.prim(graph, start_vertex)
+        elif algorithm == 'prim_multi':
+            current_result = mst_solver.prim_multi_source(graph, get_main_hubs(RESTAURANTS) or [start_vertex])
         else:
             return jsonify({'error': 'Invalid algorithm'}), 400
         
@@ -74,22 +85,12 @@ def update_costs():
                 u, v = u.strip(), v.strip()
                 
                 if u in RESTAURANTS and v in RESTAURANTS:
-                    if (u, v) in current_costs:
-                        current_costs[(u, v)] = float(cost)
-                    elif (v, u) in current_costs:
-                        current_costs[(v, u)] = float(cost)
-                    else:
-                        current_costs[(u, v)] = float(cost)
-        
-        # Convert tuple keys to string format for JSON serialization
-        costs_for_json = {}
-        for (u, v), cost in current_costs.items():
-            costs_for_json[f"{u}-{v}"] = cost
+                    current_costs.set(u, v, float(cost))
         
         return jsonify({
             'success': True,
             'message': 'Costs updated successfully',
-            'costs': costs_for_json
+            'costs': current_costs.to_json()
         })
         
     except Exception as e:
@@ -97,36 +98,72 @@ def update_costs():
 
 @app.route('/api/reset')
 def reset_data():
-    global current_costs, current_result, selected_locations
+    global current_costs, current_result, selected_locations, last_selected_result, last_solved_locations, moved_locations
     
-    current_costs = get_default_costs().copy()
+    reset_default_costs()  # update_costs edits the default store in place
+    current_costs = get_default_costs()
     current_result = None
     selected_locations = []
-    
-    # Convert tuple keys to string format for JSON serialization
-    costs_for_json = {}
-    for (u, v), cost in current_costs.items():
-        costs_for_json[f"{u}-{v}"] = cost
+    last_selected_result = None
+    last_solved_locations = []
+    moved_locations = set()
     
     return jsonify({
         'success': True,
         'message': 'Data reset to defaults',
-        'costs': costs_for_json
+        'costs': current_costs.to_json()
     })
 
 @app.route('/api/data')
 def get_data():
-    # Convert tuple keys to string format for JSON serialization
-    costs_for_json = {}
-    for (u, v), cost in current_costs.items():
-        costs_for_json[f"{u}-{v}"] = cost
-    
     return jsonify({
         'restaurants': RESTAURANTS,
-        'costs': costs_for_json,
-        'cost_matrix': get_cost_matrix()
+        'costs': current_costs.to_json(),
+        'cost_matrix': current_costs.condensed()
     })
 
+@app.route('/api/cost_matrix')
+def get_cost_matrix_view():
+    """Query the current cost matrix by vertex subset, row page or condensed form"""
+    try:
+        fmt = request.args.get('format', 'matrix')
+        vertices = request.args.get('vertices')
+        if vertices is not None:
+            vertices = [v.strip() for v in vertices.split(',') if v.strip()]
+            known = set(current_costs.vertices())
+            unknown = [v for v in vertices if v not in known]
+            if unknown:
+                return jsonify({'error': f"Unknown vertices: {', '.join(unknown)}"}), 400
+        
+        if fmt == 'condensed':
+            return jsonify({'success': True, 'cost_matrix': current_costs.condensed(vertices)})
+        if fmt != 'matrix':
+            return jsonify({'error': 'Invalid format'}), 400
+        
+        if vertices is not None:
+            matrix = current_costs.submatrix(vertices)
+        else:
+            offset = request.args.get('offset', '0')
+            limit = request.args.get('limit')
+            if not offset.isdecimal() or (limit is not None and not limit.isdecimal()):
+                return jsonify({'error': 'offset and limit must be non-negative integers'}), 400
+            offset = int(offset)
+            limit = None if limit is None else int(limit)
+            matrix = current_costs.page(offset, limit)
+        
+        # inf is not valid JSON, missing pairs are sent as null
+        matrix = {u: {v: (None if cost == float('inf') else cost) for v, cost in row.items()}
+                  for u, row in matrix.items()}
+        
+        return jsonify({
+            'success': True,
+            'cost_matrix': matrix,
+            'total_vertices': len(current_costs.vertices())
+        })
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/points/update', methods=['POST'])
 def update_point_position():
     """Update position of an existing point"""
@@ -145,10 +182,9 @@ def update_point_position():
         
         # Recalculate costs with new position
         global current_costs
-        from data.restaurants import DEFAULT_COSTS
-        # Force recalculation by clearing cached data
-        import data.restaurants
-        data.restaurants.DEFAULT_COSTS = None
+        reset_default_costs()
+        if point_id in last_solved_locations:
+            moved_locations.add(point_id)
         current_costs = get_default_costs()
         
         return jsonify({'success': True, 'message': f'Đã cập nhật vị trí điểm {point_id}'})
@@ -183,9 +219,10 @@ def add_new_point():
         }
         
         # Recalculate costs with new point
-        global current_costs
-        import data.restaurants
-        data.restaurants.DEFAULT_COSTS = None
+        global current_costs, last_selected_result
+        reset_default_costs()
+        if point_id in last_solved_locations:
+            last_selected_result = None  # Same id, possibly a different position
         current_costs = get_default_costs()
         
         return jsonify({'success': True, 'message': f'Đã thêm điểm mới: {name} ({point_id})'})
@@ -218,9 +255,10 @@ def remove_point():
             selected_locations.remove(point_id)
         
         # Recalculate costs without removed point
-        global current_costs
-        import data.restaurants
-        data.restaurants.DEFAULT_COSTS = None
+        global current_costs, last_selected_result
+        reset_default_costs()
+        if point_id in last_solved_locations:
+            last_selected_result = None  # A re-added point with this id must not reuse old edges
         current_costs = get_default_costs()
         
         return jsonify({'success': True, 'message': f'Đã xóa điểm {point_id}'})
@@ -250,29 +288,15 @@ def select_locations():
             return jsonify({'error': 'Không thể tạo đồ thị từ các địa điểm đã chọn'}), 400
         
         # Update current costs with selected locations
-        current_costs = {}
-        for i in range(len(selected_locations)):
-            for j in range(i + 1, len(selected_locations)):
-                u, v = selected_locations[i], selected_locations[j]
-                if u in RESTAURANTS and v in RESTAURANTS:
-                    from data.restaurants import haversine_distance
-                    lat1, lng1 = RESTAURANTS[u]['lat'], RESTAURANTS[u]['lng']
-                    lat2, lng2 = RESTAURANTS[v]['lat'], RESTAURANTS[v]['lng']
-                    distance = round(haversine_distance(lat1, lng1, lat2, lng2), 2)
-                    current_costs[(u, v)] = distance
+        current_costs = CostMatrix({(edge.u, edge.v): edge.weight for edge in graph.get_all_edges()})
         
         current_result = None  # Reset result when locations change
         
-        # Convert costs for JSON
-        costs_for_json = {}
-        for (u, v), cost in current_costs.items():
-            costs_for_json[f"{u}-{v}"] = cost
-        
         return jsonify({
             'success': True,
             'message': f'Đã chọn {len(selected_locations)} địa điểm',
             'selected_locations': selected_locations,
-            'costs': costs_for_json
+            'costs': current_costs.to_json()
         })
         
     except Exception as e:
@@ -288,7 +312,7 @@ def get_selected_locations():
 
 @app.route('/api/solve/selected', methods=['POST'])
 def solve_selected_mst():
-    global current_result
+    global current_result, last_selected_result, last_solved_locations, moved_locations
     
     try:
         if len(selected_locations) < 2:
@@ -297,21 +321,35 @@ def solve_selected_mst():
         data = request.get_json()
         algorithm = data.get('algorithm', 'kruskal')
         start_vertex = data.get('start_vertex', selected_locations[0])
+        warm_start = bool(data.get('warm_start', False)) and last_selected_result is not None
+        
+        if algorithm not in ('kruskal', 'prim', 'prim_multi'):
+            return jsonify({'error': 'Thuật toán không hợp lệ'}), 400
         
         graph = create_graph_from_selected_locations(selected_locations)
         if graph is None:
             return jsonify({'error': 'Không thể tạo đồ thị'}), 400
         
-        if algorithm == 'kruskal':
+        if warm_start:
+            current_result = mst_solver.warm_start(
+                graph, last_selected_result,
+                added_vertices=(set(selected_locations) - set(last_solved_locations)) | moved_locations,
+                removed_vertices=(set(last_solved_locations) - set(selected_locations)) | moved_locations)
+        elif algorithm == 'kruskal':
             current_result = mst_solver.kruskal(graph)
         elif algorithm == 'prim':
             current_result = mst_solver.prim(graph, start_vertex)
         else:
-            return jsonify({'error': 'Thuật toán không hợp lệ'}), 400
+            current_result = mst_solver.prim_multi_source(graph, get_main_hubs(selected_locations) or [start_vertex])
+        
+        last_selected_result = current_result
+        last_solved_locations = list(selected_locations)
+        moved_locations = set()
         
         return jsonify({
             'success': True,
-            'algorithm': algorithm,
+            'algorithm': 'warm_start' if warm_start else algorithm,
+            'warm_start': warm_start,
             'result': current_result.to_dict(),
             'total_steps': len(current_result.steps),
             'selected_locations': selected_locations
@@ -0,0 +1,101 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class CostMatrix:
+    """
+    Sparse, pair-indexed store of edge costs.
+
+    Each undirected pair is kept once under a canonical (min, max) key, so
+    lookups never need to probe both orientations. Dense sub-matrices and the
+    condensed array are built only for the vertices a caller asks for, and the
+    string-keyed JSON form is cached until the next mutation.
+    """
+
+    def __init__(self, costs: Optional[Dict[Tuple[str, str], float]] = None):
+        self._costs: Dict[Tuple[str, str], float] = {}
+        self._vertices: set = set()
+        self._json_cache: Optional[Dict[str, float]] = None
+        self._condensed_cache: Optional[Dict[str, list]] = None
+
+        for (u, v), cost in (costs or {}).items():
+            self._store(u, v, cost)
+
+    @staticmethod
+    def _key(u: str, v: str) -> Tuple[str, str]:
+        return (u, v) if u <= v else (v, u)
+
+    def _store(self, u: str, v: str, cost: float):
+        self._costs[self._key(u, v)] = cost
+        self._vertices.add(u)
+        self._vertices.add(v)
+
+    def _invalidate(self):
+        self._json_cache = None
+        self._condensed_cache = None
+
+    def set(self, u: str, v: str, cost: float):
+        self._store(u, v, cost)
+        self._invalidate()
+
+    def get(self, u: str, v: str) -> float:
+        if u == v:
+            return 0
+        return self._costs.get(self._key(u, v), float('inf'))
+
+    def __contains__(self, pair: Tuple[str, str]) -> bool:
+        u, v = pair
+        return self._key(u, v) in self._costs
+
+    def __len__(self) -> int:
+        return len(self._costs)
+
+    def items(self):
+        return self._costs.items()
+
+    def vertices(self) -> List[str]:
+        return sorted(self._vertices)
+
+    def _resolve(self, vertices: Optional[Iterable[str]]) -> List[str]:
+        """Known vertices from ``vertices`` (all if None), sorted and deduplicated"""
+        if vertices is None:
+            return self.vertices()
+        return sorted({v for v in vertices if v in self._vertices})
+
+    def submatrix(self, rows: Optional[Iterable[str]] = None,
+                  cols: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Dense nested dict restricted to the requested rows and columns"""
+        rows = self._resolve(rows)
+        cols = rows if cols is None else self._resolve(cols)
+        return {u: {v: self.get(u, v) for v in cols} for u in rows}
+
+    def page(self, offset: int = 0, limit: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """Rows ``offset .. offset + limit`` of the sorted vertices against all columns"""
+        vertices = self.vertices()
+        end = None if limit is None else offset + limit
+        return self.submatrix(vertices[offset:end], vertices)
+
+    def condensed(self, vertices: Optional[Iterable[str]] = None) -> Dict[str, list]:
+        """
+        Upper-triangular condensed form: for sorted vertices v0..vn-1 the
+        values are (v0,v1), (v0,v2), ..., (vn-2,vn-1). Missing pairs are None
+        so the result stays valid JSON.
+        """
+        if vertices is None and self._condensed_cache is not None:
+            return self._condensed_cache
+
+        order = self._resolve(vertices)
+        values = []
+        for i in range(len(order)):
+            for j in range(i + 1, len(order)):
+                values.append(self._costs.get(self._key(order[i], order[j])))
+
+        condensed = {'vertices': order, 'values': values}
+        if vertices is None:
+            self._condensed_cache = condensed
+        return condensed
+
+    def to_json(self) -> Dict[str, float]:
+        """``{"u-v": cost}`` mapping, rebuilt only after a mutation"""
+        if self._json_cache is None:
+            self._json_cache = {f"{u}-{v}": cost for (u, v), cost in self._costs.items()}
+        return self._json_cache
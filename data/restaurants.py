@@ -1,4 +1,5 @@
 import math
+from data.cost_matrix import CostMatrix
 
 def haversine_distance(lat1, lng1, lat2, lng2):
     """
@@ -23,7 +24,7 @@ def calculate_real_distances():
     """
     Calculate real distances between all restaurant pairs based on coordinates
     """
-    distances = {}
+    distances = CostMatrix()
     restaurants_list = list(RESTAURANTS.keys())
     
     for i in range(len(restaurants_list)):
@@ -34,7 +35,7 @@ def calculate_real_distances():
             lat2, lng2 = RESTAURANTS[v]['lat'], RESTAURANTS[v]['lng']
             
             distance = haversine_distance(lat1, lng1, lat2, lng2)
-            distances[(u, v)] = round(distance, 2)
+            distances.set(u, v, round(distance, 2))
     
     return distances
 
@@ -98,24 +99,10 @@ def get_default_costs():
         DEFAULT_COSTS = calculate_real_distances()
     return DEFAULT_COSTS
 
-def get_cost_matrix():
-    vertices = sorted(RESTAURANTS.keys())
-    matrix = {}
-    
-    costs = get_default_costs()
-    for i, u in enumerate(vertices):
-        matrix[u] = {}
-        for j, v in enumerate(vertices):
-            if i == j:
-                matrix[u][v] = 0
-            elif (u, v) in costs:
-                matrix[u][v] = costs[(u, v)]
-            elif (v, u) in costs:
-                matrix[u][v] = costs[(v, u)]
-            else:
-                matrix[u][v] = float('inf')
-    
-    return matrix
+def reset_default_costs():
+    """Drop cached distances after RESTAURANTS changes"""
+    global DEFAULT_COSTS
+    DEFAULT_COSTS = None
 
 def create_graph_from_costs(costs=None):
     from algorithms.mst import Graph
@@ -0,0 +1,81 @@
+import unittest
+
+try:
+    import app as app_module
+except ImportError:  # Flask is not installed
+    app_module = None
+
+
+@unittest.skipUnless(app_module, 'Flask is not installed')
+class TestCostMatrixRoute(unittest.TestCase):
+    def setUp(self):
+        self.client = app_module.app.test_client()
+        self.client.get('/api/reset')
+
+    def test_submatrix(self):
+        data = self.client.get('/api/cost_matrix?vertices=C,A').get_json()
+        self.assertEqual(list(data['cost_matrix']), ['A', 'C'])
+        self.assertEqual(data['cost_matrix']['A']['A'], 0)
+
+    def test_page(self):
+        data = self.client.get('/api/cost_matrix?offset=1&limit=2').get_json()
+        self.assertEqual(list(data['cost_matrix']), ['B', 'C'])
+        self.assertEqual(data['total_vertices'], len(app_module.RESTAURANTS))
+
+    def test_condensed(self):
+        data = self.client.get('/api/cost_matrix?format=condensed&vertices=B,A').get_json()
+        self.assertEqual(data['cost_matrix']['vertices'], ['A', 'B'])
+        self.assertEqual(len(data['cost_matrix']['values']), 1)
+
+    def test_data_and_matrix_share_the_store(self):
+        self.client.post('/api/update_costs', json={'costs': {'A-B': 99}})
+        data = self.client.get('/api/data').get_json()
+        self.assertEqual(data['costs']['A-B'], 99)
+        self.assertEqual(data['cost_matrix']['values'][0], 99)
+
+    def test_rejects_bad_queries(self):
+        for query in ('offset=-1', 'limit=-1', 'limit=abc', 'offset=x', 'vertices=A,ZZ', 'format=dense'):
+            response = self.client.get(f'/api/cost_matrix?{query}')
+            self.assertEqual(response.status_code, 400, query)
+
+
+@unittest.skipUnless(app_module, 'Flask is not installed')
+class TestWarmStartRoute(unittest.TestCase):
+    def setUp(self):
+        self.client = app_module.app.test_client()
+        self.client.get('/api/reset')
+        self.original_f = dict(app_module.RESTAURANTS['F'])
+        self.locations = ['A', 'B', 'C', 'D', 'E', 'F']
+        self.client.post('/api/locations/select', json={'locations': self.locations})
+        self.client.post('/api/solve/selected', json={'algorithm': 'kruskal'})
+
+    def tearDown(self):
+        app_module.RESTAURANTS['F'] = self.original_f
+        self.client.get('/api/reset')
+
+    def solve(self, warm_start):
+        response = self.client.post('/api/solve/selected', json={'algorithm': 'kruskal', 'warm_start': warm_start})
+        return response.get_json()
+
+    def test_moved_point(self):
+        self.client.post('/api/points/update', json={'pointId': 'F', 'lat': 21.2, 'lng': 106.2})
+        warm = self.solve(True)
+        cold = self.solve(False)
+        self.assertEqual(warm['algorithm'], 'warm_start')
+        self.assertAlmostEqual(warm['result']['total_cost'], cold['result']['total_cost'])
+
+    def test_removed_and_readded_point(self):
+        self.client.post('/api/points/remove', json={'pointId': 'F'})
+        self.client.post('/api/points/add', json=dict(self.original_f, pointId='F', lat=21.2, lng=106.2))
+        self.client.post('/api/locations/select', json={'locations': self.locations})
+        warm = self.solve(True)
+        cold = self.solve(False)
+        self.assertAlmostEqual(warm['result']['total_cost'], cold['result']['total_cost'])
+
+    def test_rejects_unknown_algorithm(self):
+        response = self.client.post('/api/solve/selected', json={'algorithm': 'bogus', 'warm_start': True})
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from data.cost_matrix import CostMatrix
+
+
+class TestCostMatrix(unittest.TestCase):
+    def setUp(self):
+        self.costs = CostMatrix({('B', 'A'): 1.0, ('A', 'C'): 2.0, ('C', 'D'): 3.0})
+
+    def test_lookup_ignores_orientation(self):
+        self.assertEqual(self.costs.get('A', 'B'), 1.0)
+        self.assertEqual(self.costs.get('B', 'A'), 1.0)
+        self.assertIn(('B', 'A'), self.costs)
+        self.assertEqual(self.costs.get('A', 'A'), 0)
+        self.assertEqual(self.costs.get('A', 'D'), float('inf'))
+        self.assertEqual(len(self.costs), 3)
+
+    def test_set_overwrites_either_orientation(self):
+        self.costs.set('C', 'A', 5.0)
+        self.assertEqual(self.costs.get('A', 'C'), 5.0)
+        self.assertEqual(len(self.costs), 3)
+
+    def test_set_invalidates_caches(self):
+        json_before = self.costs.to_json()
+        condensed_before = self.costs.condensed()
+        self.assertIs(self.costs.to_json(), json_before)
+        self.assertIs(self.costs.condensed(), condensed_before)
+
+        self.costs.set('B', 'D', 4.0)
+        self.assertEqual(self.costs.to_json()['B-D'], 4.0)
+        self.assertIn(4.0, self.costs.condensed()['values'])
+
+    def test_submatrix_sorts_and_dedupes(self):
+        matrix = self.costs.submatrix(['C', 'A', 'A', 'Z'])
+        self.assertEqual(list(matrix), ['A', 'C'])
+        self.assertEqual(matrix['A'], {'A': 0, 'C': 2.0})
+
+    def test_page(self):
+        page = self.costs.page(1, 2)
+        self.assertEqual(list(page), ['B', 'C'])
+        self.assertEqual(list(page['B']), ['A', 'B', 'C', 'D'])
+        self.assertEqual(list(self.costs.page(3)), ['D'])
+
+    def test_condensed(self):
+        condensed = self.costs.condensed()
+        self.assertEqual(condensed['vertices'], ['A', 'B', 'C', 'D'])
+        # (A,B) (A,C) (A,D) (B,C) (B,D) (C,D)
+        self.assertEqual(condensed['values'], [1.0, 2.0, None, None, None, 3.0])
+        subset = self.costs.condensed(['C', 'A', 'C'])
+        self.assertEqual(subset, {'vertices': ['A', 'C'], 'values': [2.0]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import random
+import unittest
+
+from algorithms.mst import MST_Solver, Graph
+
+
+def build_graph(points):
+    graph = Graph()
+    ids = sorted(points)
+    for i in range(len(ids)):
+        for j in range(i + 1, len(ids)):
+            (x1, y1), (x2, y2) = points[ids[i]], points[ids[j]]
+            graph.add_edge(ids[i], ids[j], round(((x1 - x2) ** 2 + (y1 - y2) ** 2) ** 0.5, 6))
+    return graph
+
+
+def reweight(graph, factors):
+    """Copy of ``graph`` with the weight of each pair in ``factors`` multiplied"""
+    result = Graph()
+    for edge in graph.get_all_edges():
+        factor = factors.get(frozenset((edge.u, edge.v)), 1)
+        result.add_edge(edge.u, edge.v, edge.weight * factor)
+    return result
+
+
+class TestMultiSourcePrim(unittest.TestCase):
+    def test_matches_kruskal(self):
+        rng = random.Random(1)
+        solver = MST_Solver()
+        for _ in range(20):
+            points = {f'P{i}': (rng.random(), rng.random()) for i in range(40)}
+            graph = build_graph(points)
+            sources = rng.sample(sorted(points), 3)
+            expected = solver.kruskal(graph)
+            result = solver.prim_multi_source(graph, sources)
+            self.assertEqual(len(result.edges), len(points) - 1)
+            self.assertAlmostEqual(result.total_cost, expected.total_cost)
+
+
+class TestWarmStart(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(2)
+        self.solver = MST_Solver()
+
+    def random_points(self, n=40):
+        return {f'P{i}': (self.rng.random(), self.rng.random()) for i in range(n)}
+
+    def assert_matches_kruskal(self, graph, result):
+        expected = self.solver.kruskal(graph)
+        self.assertEqual(len(result.edges), len(graph.vertices) - 1)
+        self.assertAlmostEqual(result.total_cost, expected.total_cost)
+        return expected
+
+    def test_intact_tree_with_added_vertices(self):
+        for _ in range(20):
+            points = self.random_points()
+            previous = self.solver.kruskal(build_graph(points))
+            added = [f'N{i}' for i in range(3)]
+            for vertex in added:
+                points[vertex] = (self.rng.random(), self.rng.random())
+            graph = build_graph(points)
+            result = self.solver.warm_start(graph, previous, added_vertices=added)
+            expected = self.assert_matches_kruskal(graph, result)
+            self.assertLess(result.edges_examined, expected.edges_examined)
+
+    def test_intact_tree_with_reweighted_non_tree_edges(self):
+        for _ in range(20):
+            graph = build_graph(self.random_points())
+            previous = self.solver.kruskal(graph)
+            tree_pairs = {frozenset((e.u, e.v)) for e in previous.edges}
+            non_tree = [frozenset((e.u, e.v)) for e in graph.get_all_edges()
+                        if frozenset((e.u, e.v)) not in tree_pairs]
+            factors = {pair: self.rng.choice([0.1, 3]) for pair in self.rng.sample(non_tree, 5)}
+            changed = reweight(graph, factors)
+            result = self.solver.warm_start(changed, previous, changed_edges=[tuple(p) for p in factors])
+            self.assert_matches_kruskal(changed, result)
+
+    def test_pieces_after_removed_vertices(self):
+        for _ in range(20):
+            points = self.random_points()
+            previous = self.solver.kruskal(build_graph(points))
+            removed = self.rng.sample(sorted(points), 3)
+            for vertex in removed:
+                del points[vertex]
+            graph = build_graph(points)
+            result = self.solver.warm_start(graph, previous, removed_vertices=removed)
+            self.assert_matches_kruskal(graph, result)
+
+    def test_pieces_after_heavier_tree_edge(self):
+        for _ in range(20):
+            graph = build_graph(self.random_points(60))
+            previous = self.solver.kruskal(graph)
+            edge = self.rng.choice(previous.edges)
+            changed = reweight(graph, {frozenset((edge.u, edge.v)): 5})
+            result = self.solver.warm_start(changed, previous, changed_edges=[(edge.u, edge.v)])
+            expected = self.assert_matches_kruskal(changed, result)
+            self.assertLess(result.edges_examined, expected.edges_examined)
+
+    def test_mixed_delta(self):
+        for _ in range(20):
+            points = self.random_points()
+            graph = build_graph(points)
+            previous = self.solver.kruskal(graph)
+            removed = self.rng.sample(sorted(points), 2)
+            for vertex in removed:
+                del points[vertex]
+            points['N0'] = (self.rng.random(), self.rng.random())
+            graph = build_graph(points)
+            result = self.solver.warm_start(graph, previous, added_vertices=['N0'], removed_vertices=removed)
+            expected = self.assert_matches_kruskal(graph, result)
+            self.assertLess(result.edges_examined, expected.edges_examined)
+
+    def test_mixed_reweights(self):
+        for _ in range(20):
+            graph = build_graph(self.random_points())
+            previous = self.solver.kruskal(graph)
+            factors = {frozenset((e.u, e.v)): 5 for e in self.rng.sample(previous.edges, 2)}
+            for e in self.rng.sample(graph.get_all_edges(), 5):
+                factors.setdefault(frozenset((e.u, e.v)), self.rng.choice([0.1, 3]))
+            changed = reweight(graph, factors)
+            result = self.solver.warm_start(changed, previous, changed_edges=[tuple(p) for p in factors])
+            self.assert_matches_kruskal(changed, result)
+
+    def test_moved_vertex(self):
+        for _ in range(20):
+            points = self.random_points(60)
+            previous = self.solver.kruskal(build_graph(points))
+            moved = self.rng.choice(sorted(points))
+            points[moved] = (self.rng.random(), self.rng.random())
+            graph = build_graph(points)
+            result = self.solver.warm_start(graph, previous, added_vertices=[moved], removed_vertices=[moved])
+            expected = self.assert_matches_kruskal(graph, result)
+            self.assertLess(result.edges_examined, expected.edges_examined)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,451 @@
+"""
+Load-test harness for the Flask API.
+
+Starts ``app`` on a local port, seeds it with a synthetic point set, then
+hits each endpoint with concurrent requests and finally replays a mix of
+mutations and solves. Reports p50/p99 latency, throughput, error rate with
+status codes and a sample error body, a latency histogram and traced memory
+per endpoint.
+
+Memory is traced for the whole process, server and client threads alike.
+``memory_peak_kb`` is the high-water mark above the start of a phase and
+``memory_net_kb`` the net process delta once the phase is over; both are
+taken after a ``gc.collect()``.
+
+    python tools/load_test.py run --points 300 --requests 50 --output base.json
+    python tools/load_test.py run --mix recorded_mix.json --output new.json
+    python tools/load_test.py compare base.json new.json
+"""
+import argparse
+import gc
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+import urllib.error
+import urllib.request
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Hà Nội bounding box used for synthetic points
+LAT_RANGE = (20.95, 21.10)
+LNG_RANGE = (105.75, 105.92)
+
+HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+ENDPOINTS = ['solve', 'solve_selected', 'compare', 'points_update', 'points_add', 'points_remove']
+
+DEFAULT_MIX_WEIGHTS = {
+    'solve': 1,
+    'solve_selected': 3,
+    'compare': 1,
+    'points_update': 3,
+    'points_add': 1,
+    'points_remove': 1,
+}
+
+
+def random_position(rng):
+    return round(rng.uniform(*LAT_RANGE), 6), round(rng.uniform(*LNG_RANGE), 6)
+
+
+class Workload:
+    """
+    Builds (method, path, body) requests for each endpoint name. Added points
+    are only handed to removals once their add request has succeeded, so a
+    remove never races the add it depends on.
+    """
+
+    def __init__(self, point_ids, seed=0):
+        self.point_ids = list(point_ids)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.added = deque()
+        self.counter = 0
+
+    def request(self, endpoint, body=None):
+        with self.lock:
+            if endpoint == 'solve':
+                return 'POST', '/api/solve', body or {'algorithm': 'kruskal'}
+            if endpoint == 'solve_selected':
+                return 'POST', '/api/solve/selected', body or {'algorithm': 'kruskal'}
+            if endpoint == 'compare':
+                return 'GET', '/api/compare', None
+            if endpoint == 'points_update':
+                lat, lng = random_position(self.rng)
+                return 'POST', '/api/points/update', body or {
+                    'pointId': self.rng.choice(self.point_ids), 'lat': lat, 'lng': lng}
+            if endpoint == 'points_add':
+                self.counter += 1
+                point_id = f'LT{self.counter}'
+                lat, lng = random_position(self.rng)
+                return 'POST', '/api/points/add', body or {
+                    'pointId': point_id, 'name': point_id, 'lat': lat, 'lng': lng}
+            if endpoint == 'points_remove':
+                if body is None and not self.added:
+                    return None  # Nothing left to remove, the caller skips it
+                return 'POST', '/api/points/remove', body or {'pointId': self.added.popleft()}
+        raise ValueError(f'Unknown endpoint: {endpoint}')
+
+    def record(self, endpoint, payload, ok):
+        if endpoint == 'points_add' and ok:
+            with self.lock:
+                self.added.append(payload['pointId'])
+
+
+def send(base_url, method, path, body, timeout):
+    """Returns (latency ms, ok, status code or None, error text or None)"""
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(base_url + path, data=data, method=method,
+                                 headers={'Content-Type': 'application/json'})
+    start = time.perf_counter()
+    status, error = None, None
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+        error = e.read()[:300].decode('utf-8', errors='replace')
+    except (urllib.error.URLError, OSError) as e:
+        error = str(getattr(e, 'reason', e))
+    latency = (time.perf_counter() - start) * 1000
+    return latency, status is not None and status < 400, status, error
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def histogram(latencies):
+    counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    for latency in latencies:
+        for i, bound in enumerate(HISTOGRAM_BOUNDS_MS):
+            if latency <= bound:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    labels = [f'<={bound}ms' for bound in HISTOGRAM_BOUNDS_MS] + [f'>{HISTOGRAM_BOUNDS_MS[-1]}ms']
+    return dict(zip(labels, counts))
+
+
+def summarize(samples, wall_time, memory=None, skipped=0):
+    """``memory`` is (peak, net) bytes, None when it cannot be attributed to this group"""
+    latencies = sorted(sample[0] for sample in samples)
+    failed = [sample for sample in samples if not sample[1]]
+    errors = len(failed)
+    return {
+        'requests': len(samples),
+        'skipped': skipped,
+        'errors': errors,
+        'error_rate': errors / len(samples) if samples else 0.0,
+        'p50_ms': percentile(latencies, 50),
+        'p99_ms': percentile(latencies, 99),
+        'max_ms': latencies[-1] if latencies else 0.0,
+        'throughput_rps': len(samples) / wall_time if wall_time > 0 else 0.0,
+        'memory_peak_kb': None if memory is None else memory[0] / 1024,
+        'memory_net_kb': None if memory is None else memory[1] / 1024,
+        'status_codes': dict(Counter(str(sample[2]) for sample in samples)),
+        'error_sample': failed[0][3] if failed else None,
+        'histogram': histogram(latencies),
+    }
+
+
+def run_phase(base_url, workload, sequence, concurrency, timeout):
+    """Fire ``sequence`` of (endpoint, body) pairs; returns per-endpoint samples and skip counts"""
+    samples = {}
+    skipped = {}
+    lock = threading.Lock()
+
+    def worker(endpoint, body):
+        built = workload.request(endpoint, body)
+        if built is None:
+            with lock:
+                skipped[endpoint] = skipped.get(endpoint, 0) + 1
+            return
+        method, path, payload = built
+        result = send(base_url, method, path, payload, timeout)
+        workload.record(endpoint, payload, result[1])
+        with lock:
+            samples.setdefault(endpoint, []).append(result)
+
+    gc.collect()
+    mem_before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(worker, endpoint, body) for endpoint, body in sequence]
+        for future in futures:
+            future.result()
+    wall_time = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    gc.collect()
+    memory = (peak - mem_before, tracemalloc.get_traced_memory()[0] - mem_before)
+    return samples, skipped, wall_time, memory
+
+
+def parse_endpoints(value):
+    endpoints = [name.strip() for name in value.split(',') if name.strip()]
+    unknown = [name for name in endpoints if name not in ENDPOINTS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown endpoint(s) {', '.join(unknown)}; choose from {', '.join(ENDPOINTS)}")
+    return endpoints
+
+
+def load_mix(path):
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    unknown = sorted({entry['endpoint'] for entry in entries} - set(ENDPOINTS))
+    if unknown:
+        raise ValueError(f"Mix {path} has unknown endpoint(s): {', '.join(unknown)}")
+    return [(entry['endpoint'], entry.get('body')) for entry in entries]
+
+
+def generate_mix(length, seed):
+    rng = random.Random(seed)
+    names = list(DEFAULT_MIX_WEIGHTS)
+    weights = [DEFAULT_MIX_WEIGHTS[name] for name in names]
+    mix, pending_adds = [], 0
+    for name in rng.choices(names, weights=weights, k=length):
+        # Only remove points the mix has already added
+        if name == 'points_remove' and pending_adds == 0:
+            name = 'points_add'
+        pending_adds += {'points_add': 1, 'points_remove': -1}.get(name, 0)
+        mix.append((name, None))
+    return mix
+
+
+def start_server():
+    from werkzeug.serving import make_server
+    from app import app
+
+    # The per-request access log would bury the report
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f'http://127.0.0.1:{server.port}'
+
+
+def seed_points(count, seed):
+    """
+    Fill RESTAURANTS in-process and compute the cost store once. Adding the
+    points over HTTP would recompute all distances per add, O(n^3) overall.
+    """
+    import app
+    from data.restaurants import RESTAURANTS, get_default_costs, reset_default_costs
+
+    rng = random.Random(seed)
+    point_ids = []
+    for i in range(count):
+        point_id = f'S{i}'
+        lat, lng = random_position(rng)
+        RESTAURANTS[point_id] = {
+            'name': point_id,
+            'location': 'Load test',
+            'type': 'branch',
+            'description': 'Synthetic load-test point',
+            'lat': lat,
+            'lng': lng
+        }
+        point_ids.append(point_id)
+    reset_default_costs()
+    app.current_costs = get_default_costs()
+    return point_ids
+
+
+def prepare_removals(base_url, workload, count, timeout):
+    """Add ``count`` points outside the measurement so the remove phase has targets"""
+    for _ in range(count):
+        method, path, payload = workload.request('points_add')
+        _, ok, _, _ = send(base_url, method, path, payload, timeout)
+        workload.record('points_add', payload, ok)
+
+
+def run(args):
+    seed_start = time.perf_counter()
+    point_ids = seed_points(args.points, args.seed)
+    print(f'Seeded {len(point_ids)} points in {time.perf_counter() - seed_start:.2f}s')
+
+    tracemalloc.start()
+    server, base_url = start_server()
+    try:
+        select = point_ids[:args.select or args.points]
+        _, ok, status, error = send(base_url, 'POST', '/api/locations/select', {'locations': select}, args.timeout)
+        if not ok:
+            raise RuntimeError(f'Selecting {len(select)} points failed ({status}): {error}')
+
+        workload = Workload(point_ids, args.seed)
+        report = {
+            'config': {'points': args.points, 'select': args.select or args.points,
+                       'requests': args.requests, 'concurrency': args.concurrency},
+            'endpoints': {},
+            'mix': {},
+        }
+
+        for endpoint in args.endpoints or ENDPOINTS:
+            if endpoint == 'points_remove':
+                prepare_removals(base_url, workload, args.requests, args.timeout)
+            samples, skipped, wall_time, memory = run_phase(
+                base_url, workload, [(endpoint, None)] * args.requests, args.concurrency, args.timeout)
+            report['endpoints'][endpoint] = summarize(
+                samples.get(endpoint, []), wall_time, memory, skipped.get(endpoint, 0))
+
+        mix = load_mix(args.mix) if args.mix else generate_mix(args.mix_length, args.seed)
+        if args.save_mix:
+            with open(args.save_mix, 'w', encoding='utf-8') as f:
+                json.dump([{'endpoint': name, 'body': body} for name, body in mix], f, indent=2)
+        samples, skipped, wall_time, memory = run_phase(base_url, workload, mix, args.concurrency, args.timeout)
+        # Endpoints share the mix phase, so memory is only attributed to the total
+        report['mix'] = {
+            'total': summarize([s for group in samples.values() for s in group], wall_time, memory,
+                               sum(skipped.values())),
+            'endpoints': {name: summarize(samples.get(name, []), wall_time, None, skipped.get(name, 0))
+                          for name in sorted(set(samples) | set(skipped))},
+        }
+    finally:
+        server.shutdown()
+        tracemalloc.stop()
+
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f'Report written to {args.output}')
+
+
+def print_report(report):
+    header = (f"{'endpoint':<16}{'reqs':>6}{'skip':>6}{'err%':>7}{'p50 ms':>10}{'p99 ms':>10}"
+              f"{'rps':>9}{'peak KB':>10}{'net KB':>10}")
+
+    def kb(value):
+        return 'n/a' if value is None else f'{value:.1f}'
+
+    def row(name, stats):
+        return (f"{name:<16}{stats['requests']:>6}{stats['skipped']:>6}{stats['error_rate'] * 100:>7.1f}"
+                f"{stats['p50_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['throughput_rps']:>9.1f}"
+                f"{kb(stats['memory_peak_kb']):>10}{kb(stats['memory_net_kb']):>10}")
+
+    print('\nPer-endpoint phases')
+    print(header)
+    for name, stats in report['endpoints'].items():
+        print(row(name, stats))
+
+    if report['mix']:
+        print('\nReplayed mix')
+        print(header)
+        print(row('total', report['mix']['total']))
+        for name, stats in report['mix']['endpoints'].items():
+            print(row(name, stats))
+
+    print('\nLatency histograms')
+    for name, stats in report['endpoints'].items():
+        buckets = ', '.join(f'{label}: {count}' for label, count in stats['histogram'].items() if count)
+        print(f'  {name:<16}{buckets}')
+
+    skipped = [(section, name, stats['skipped'])
+               for section, group in (('phase', report['endpoints']), ('mix', report['mix'].get('endpoints', {})))
+               for name, stats in group.items() if stats['skipped']]
+    for section, name, count in skipped:
+        print(f'\nSkipped {count} {name} request(s) in {section}: no added point left to remove')
+
+    failing = [(section, name, stats)
+               for section, group in (('phase', report['endpoints']), ('mix', report['mix'].get('endpoints', {})))
+               for name, stats in group.items() if stats['errors']]
+    if failing:
+        print('\nErrors')
+    for section, name, stats in failing:
+        codes = ', '.join(f'{code}: {count}' for code, count in sorted(stats['status_codes'].items()))
+        print(f'  {section} {name}: {codes}')
+        print(f"    sample: {stats['error_sample']}")
+
+
+def compare(args):
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.candidate, encoding='utf-8') as f:
+        candidate = json.load(f)
+
+    groups = [(name, baseline['endpoints'].get(name), stats) for name, stats in candidate['endpoints'].items()]
+    if baseline.get('mix') and candidate.get('mix'):
+        groups.append(('mix:total', baseline['mix']['total'], candidate['mix']['total']))
+        groups += [(f'mix:{name}', baseline['mix']['endpoints'].get(name), stats)
+                   for name, stats in candidate['mix']['endpoints'].items()]
+
+    regressions = []
+    print(f"{'endpoint':<22}{'metric':<18}{'baseline':>12}{'candidate':>12}{'ratio':>8}")
+    for name, old_stats, new_stats in groups:
+        if old_stats is None:
+            continue
+        for metric in ('p50_ms', 'p99_ms', 'error_rate', 'throughput_rps', 'memory_peak_kb'):
+            old, new = old_stats.get(metric), new_stats.get(metric)
+            if old is None or new is None:
+                continue
+            ratio = new / old if old > 0 else (float('inf') if new > 0 else 1.0)
+            if metric == 'error_rate':
+                worse = new > old
+            elif metric == 'throughput_rps':
+                worse = ratio < 1 / args.threshold
+            elif metric == 'memory_peak_kb':
+                # Small absolute growth is allocator noise, not a regression
+                worse = new > max(old, 0) * args.threshold and new - old > args.memory_slack_kb
+            else:
+                worse = ratio > args.threshold
+            flag = '  REGRESSION' if worse else ''
+            print(f'{name:<22}{metric:<18}{old:>12.2f}{new:>12.2f}{ratio:>8.2f}{flag}')
+            if worse:
+                regressions.append((name, metric))
+
+    if regressions:
+        print(f'\n{len(regressions)} regression(s) above threshold {args.threshold}x')
+        return 1
+    print(f'\nNo regressions above threshold {args.threshold}x')
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the MST Flask API')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='Run the load test against a local app')
+    run_parser.add_argument('--points', type=int, default=200, help='Synthetic points to add')
+    run_parser.add_argument('--select', type=int, default=0, help='Points to select (default: all)')
+    run_parser.add_argument('--requests', type=int, default=50, help='Requests per endpoint phase')
+    run_parser.add_argument('--concurrency', type=int, default=8)
+    run_parser.add_argument('--endpoints', type=parse_endpoints,
+                            help=f"Comma-separated subset of {','.join(ENDPOINTS)}")
+    run_parser.add_argument('--mix', help='JSON file of recorded [{"endpoint", "body"}] operations to replay')
+    run_parser.add_argument('--mix-length', type=int, default=200, help='Length of the generated mix')
+    run_parser.add_argument('--save-mix', help='Write the replayed mix to this file')
+    run_parser.add_argument('--timeout', type=float, default=60.0)
+    run_parser.add_argument('--seed', type=int, default=0)
+    run_parser.add_argument('--output', help='Write the JSON report to this file')
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two JSON reports')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument('--threshold', type=float, default=1.5,
+                                help='Latency ratio above which a metric counts as a regression')
+    compare_parser.add_argument('--memory-slack-kb', type=float, default=256.0,
+                                help='Peak memory growth below this many KB is never flagged')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())